@@ -26,13 +26,241 @@ if sys.version_info[0] == 3 and sys.version_info[1] < 6:
 import os
 import re
 import json
+import mmap
+import hashlib
+import shutil
+import sqlite3
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from collections import defaultdict
-from typing import Dict, List, Set, Tuple
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+try:
+    import orjson  # Optional: much faster report serialization
+except ImportError:
+    orjson = None
+
+try:
+    import re2  # Optional: google-re2 scans in guaranteed linear time
+except ImportError:
+    re2 = None
+
+
+def _compile_linear(pattern: bytes):
+    """
+    Compile a file-scanning pattern with RE2 when it is installed.
+    
+    Patterns like ([^;]+); make the backtracking re engine rescan to the
+    end of the file for every match attempt after the last ';', which is
+    quadratic on large minified CSS. RE2 is a DFA and stays linear. Falls
+    back to re when RE2 is missing or rejects the pattern.
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern)
+
+
+# Design-token patterns, one per kind. Each is scanned with its own finditer
+# (overlapping declarations such as `--card-border-radius: 12px;` must reach
+# both the CSS variable and the radius pass), on raw bytes so only captured
+# values need decoding.
+#
+# Declaration values end at ';' or at the '}' closing the rule (minified CSS
+# drops the last ';'), and never cross '{'/'}', so one match can't swallow the
+# declarations after it. ${...} interpolations (styled-components) are kept.
+_DECLARATION_VALUE = rb'((?:[^;{}]|\$\{[^{}]*\})+)[;}]'
+_CSS_VAR_RE = _compile_linear(rb'--[\w-]+:\s*' + _DECLARATION_VALUE)
+_COLOR_RE = _compile_linear(rb'(?:color|background|bg|border-color|fill|stroke):\s*(#[0-9a-fA-F]{3,8}|rgba?\([^)]+\)|hsl\([^)]+\))')
+_SHADOW_RE = _compile_linear(rb'(?:box-shadow|shadow):\s*' + _DECLARATION_VALUE)
+_RADIUS_RE = _compile_linear(rb'(?:border-radius|rounded):\s*' + _DECLARATION_VALUE)
+_SPACING_RE = _compile_linear(rb'(?:padding|margin|gap):\s*' + _DECLARATION_VALUE)
+
+# Token category each plain-value pattern feeds
+_TOKEN_VALUE_RES = (
+    (_COLOR_RE, "colors"),
+    (_SHADOW_RE, "shadows"),
+    (_RADIUS_RE, "border_radius"),
+    (_SPACING_RE, "spacing"),
+)
+
+# CSS variable keywords -> (precedence, category). A name mentioning several
+# keywords goes to the category listed first, e.g. --shadow-color is a color.
+_CSS_VAR_KEYWORDS = {
+    keyword: (rank, category)
+    for rank, (category, keywords) in enumerate([
+        ("colors", [b'color', b'bg', b'background', b'border', b'text']),
+        ("shadows", [b'shadow']),
+        ("border_radius", [b'radius']),
+        ("spacing", [b'spacing', b'gap', b'padding', b'margin']),
+        ("font_families", [b'font-family']),
+        ("font_sizes", [b'font-size']),
+        ("z_index", [b'z-index']),
+    ])
+    for keyword in keywords
+}
+# Lookahead so overlapping keywords are all seen, e.g. both in "radiushadow"
+_CSS_VAR_KEYWORD_RE = re.compile(b'(?=(' + b'|'.join(re.escape(k) for k in _CSS_VAR_KEYWORDS) + b'))')
+
+# Literal prefixes every design-token pattern match must contain on one line.
+# Fed to ripgrep to find candidate files; keep in sync with the patterns above.
+_TOKEN_PREFILTER = r'--[\w-]+:|(?:color|background|bg|fill|stroke|shadow|border-radius|rounded|padding|margin|gap):'
+
+_HOOKS_RE = re.compile(rb'use(?:State|Effect|Callback|Memo)')
+_IMPORT_RE = _compile_linear(rb'import\s+.*?from\s+[\'"]([^\'"]+)[\'"]')
+
+_TOKEN_CATEGORIES = ("colors", "shadows", "border_radius", "spacing", "font_families", "font_sizes", "z_index")
+
+# Dependency, VCS and build output directories; never descended into
+_PRUNE_DIRS = frozenset({'node_modules', '.git', 'dist', 'build', '.next'})
+
+# Component and import analysis only look at a sample of files; the walk
+# stops handing files to them once these are reached
+_COMPONENT_SAMPLE_SIZE = 10
+_IMPORT_SAMPLE_SIZE = 20  # Per extension
+
+# Below this many files, process start-up costs more than the scan itself
+_PARALLEL_MIN_FILES = 200
+
+# Per-project cache of extracted tokens keyed by file content hash, so warm
+# re-runs only rescan files that changed
+_CACHE_FILENAME = ".pattern-enforcer-cache.sqlite"
+# Bump when the cache layout or token extraction changes in a way the
+# fingerprint below can't see; a mismatch empties the cache on the next run.
+_CACHE_SCHEMA_VERSION = 3
+_CACHE_FINGERPRINT = hashlib.sha256(repr((
+    _CACHE_SCHEMA_VERSION,
+    _CSS_VAR_RE.pattern,
+    [(regex.pattern, category) for regex, category in _TOKEN_VALUE_RES],
+    sorted(_CSS_VAR_KEYWORDS.items()),
+)).encode('utf-8')).hexdigest()
+
+
+def _json_dumps(obj) -> bytes:
+    """Compact JSON encoding, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _json_loads(data: bytes):
+    """Decode JSON produced by _json_dumps."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def _scan_file(task: Tuple[str, bool, bool, bool, bytes]) -> Dict:
+    """
+    Scan one file for design tokens, component traits and imports.
+    
+    Runs in worker processes, so it is a top-level function that only
+    touches its arguments.
+    
+    Args:
+        task: (path, wants_tokens, wants_component, wants_imports, cached_sha256)
+        
+    Returns:
+        Dict with "tokens" (category -> set, or None when cached_sha256
+        still matches), "sha256" (content digest when tokens were wanted),
+        "component" (traits or None) and "imports" (kind -> list), or None
+        if the file can't be read or is binary
+    """
+    path, wants_tokens, wants_component, wants_imports, cached_sha256 = task
+    result = {
+        "tokens": {category: set() for category in _TOKEN_CATEGORIES},
+        "sha256": None,
+        "component": None,
+        "imports": {"absolute": [], "relative": [], "alias": []},
+    }
+    
+    try:
+        with open(path, 'rb') as f:
+            # mmap refuses empty files, which have nothing to scan anyway
+            if os.fstat(f.fileno()).st_size:
+                content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                content = b''
+    except (OSError, ValueError):
+        return None
+    
+    try:
+        # A NUL byte near the start means binary data, not source
+        if content.find(b'\x00', 0, 4096) != -1:
+            return None
+        
+        if wants_tokens:
+            result["sha256"] = hashlib.sha256(content).digest()
+            if result["sha256"] == cached_sha256:
+                result["tokens"] = None  # Unchanged; the caller has them cached
+            else:
+                _extract_design_tokens(content, result["tokens"])
+        if wants_component:
+            result["component"] = _component_traits(path, content)
+        if wants_imports:
+            _classify_imports(content, result["imports"])
+    finally:
+        if isinstance(content, mmap.mmap):
+            content.close()
+    
+    return result
+
+
+def _extract_design_tokens(content: bytes, tokens: Dict[str, Set[str]]):
+    """Extract design tokens from CSS, Tailwind config, or style file content."""
+    for match in _CSS_VAR_RE.finditer(content):
+        _categorize_css_var(match.group(0), match.group(1).strip(), tokens)
+    
+    for regex, category in _TOKEN_VALUE_RES:
+        add = tokens[category].add
+        for match in regex.finditer(content):
+            add(match.group(1).decode('utf-8', 'replace'))
+
+
+def _categorize_css_var(var_name: bytes, value: bytes, tokens: Dict[str, Set[str]]):
+    """Categorize CSS variable by type, decoding it only once it is kept."""
+    ranks = [_CSS_VAR_KEYWORDS[match.group(1)] for match in _CSS_VAR_KEYWORD_RE.finditer(var_name.lower())]
+    if not ranks:
+        return
+    
+    _, category = min(ranks)
+    tokens[category].add(f"{var_name.decode('utf-8', 'replace')}: {value.decode('utf-8', 'replace')}")
+
+
+def _component_traits(path: str, content: bytes) -> Dict[str, bool]:
+    """Detect the structure patterns of a single component file."""
+    # find() rather than `in`: mmap membership tests single bytes only
+    has = lambda needle: content.find(needle) != -1
+    return {
+        "has_typescript": os.path.splitext(path)[1] in ['.tsx', '.ts'],
+        "has_props_interface": has(b'interface Props') or has(b'type Props'),
+        "uses_hooks": _HOOKS_RE.search(content) is not None,
+        "uses_children": has(b'children'),
+        "exports_default": has(b'export default'),
+        "exports_named": has(b'export {') or has(b'export const'),
+    }
+
+
+def _classify_imports(content: bytes, import_patterns: Dict[str, List[str]]):
+    """Classify the import statements of a single file."""
+    # Find import statements (finditer, as RE2's findall can't scan an mmap)
+    for match in _IMPORT_RE.finditer(content):
+        imp = match.group(1).decode('utf-8', 'replace')
+        if imp.startswith('@/'):
+            import_patterns["alias"].append(imp)
+        elif imp.startswith('.'):
+            import_patterns["relative"].append(imp)
+        else:
+            import_patterns["absolute"].append(imp)
+
 
 class FrontendAnalyzer:
-    def __init__(self, project_path: str):
+    def __init__(self, project_path: str, use_cache: bool = True):
         self.project_path = Path(project_path)
+        self.use_cache = use_cache
         self.patterns = {
             "design_tokens": {
                 "colors": set(),
@@ -46,23 +274,21 @@ class FrontendAnalyzer:
             "folder_structure": {},
             "component_patterns": [],
             "naming_conventions": {
-                "files": [],
+                "files": {},
                 "components": [],
                 "variables": []
             },
             "import_patterns": [],
             "css_patterns": []
         }
-    
+        self._naming_counter = Counter()
+
     def analyze(self) -> Dict:
         """Run full analysis on the project."""
         print(f"🔍 Analyzing project at: {self.project_path}")
         
         self._analyze_folder_structure()
-        self._extract_design_tokens()
-        self._analyze_component_patterns()
-        self._analyze_naming_conventions()
-        self._analyze_import_patterns()
+        self._scan_files()
         
         return self._generate_report()
     
@@ -83,12 +309,9 @@ class FrontendAnalyzer:
         }
         
         for root, dirs, files in os.walk(self.project_path):
+            dirs[:] = [d for d in dirs if d not in _PRUNE_DIRS]
             rel_path = os.path.relpath(root, self.project_path)
             
-            # Skip node_modules, .git, dist, build
-            if any(skip in rel_path for skip in ['node_modules', '.git', 'dist', 'build', '.next']):
-                continue
-            
             for pattern_name in common_patterns.keys():
                 if pattern_name in rel_path.lower():
                     common_patterns[pattern_name].append(rel_path)
@@ -97,151 +320,206 @@ class FrontendAnalyzer:
             k: v for k, v in common_patterns.items() if v
         }
     
-    def _extract_design_tokens(self):
-        """Extract design tokens from CSS, Tailwind config, or style files."""
-        print("🎨 Extracting design tokens...")
-        
-        # Patterns to search for
-        css_var_pattern = r'--[\w-]+:\s*([^;]+);'
-        color_pattern = r'(?:color|background|bg|border-color|fill|stroke):\s*(#[0-9a-fA-F]{3,8}|rgba?\([^)]+\)|hsl\([^)]+\))'
-        shadow_pattern = r'(?:box-shadow|shadow):\s*([^;]+);'
-        radius_pattern = r'(?:border-radius|rounded):\s*([^;]+);'
-        spacing_pattern = r'(?:padding|margin|gap):\s*([^;]+);'
-        
-        # Search in various file types
-        extensions = ['.css', '.scss', '.ts', '.tsx', '.js', '.jsx', '.config.js', '.config.ts']
-        
-        for ext in extensions:
-            for file_path in self.project_path.rglob(f'*{ext}'):
-                if 'node_modules' in str(file_path):
-                    continue
-                
-                try:
-                    content = file_path.read_text(encoding='utf-8')
-                    
-                    # Extract CSS variables
-                    for match in re.finditer(css_var_pattern, content):
-                        value = match.group(1).strip()
-                        self._categorize_css_var(match.group(0), value)
-                    
-                    # Extract colors
-                    for match in re.finditer(color_pattern, content):
-                        self.patterns["design_tokens"]["colors"].add(match.group(1))
-                    
-                    # Extract shadows
-                    for match in re.finditer(shadow_pattern, content):
-                        self.patterns["design_tokens"]["shadows"].add(match.group(1))
-                    
-                    # Extract border radius
-                    for match in re.finditer(radius_pattern, content):
-                        self.patterns["design_tokens"]["border_radius"].add(match.group(1))
-                    
-                    # Extract spacing
-                    for match in re.finditer(spacing_pattern, content):
-                        self.patterns["design_tokens"]["spacing"].add(match.group(1))
-                    
-                except Exception as e:
-                    continue
-    
-    def _categorize_css_var(self, var_name: str, value: str):
-        """Categorize CSS variable by type."""
-        var_lower = var_name.lower()
-        
-        if any(keyword in var_lower for keyword in ['color', 'bg', 'background', 'border', 'text']):
-            self.patterns["design_tokens"]["colors"].add(f"{var_name}: {value}")
-        elif 'shadow' in var_lower:
-            self.patterns["design_tokens"]["shadows"].add(f"{var_name}: {value}")
-        elif 'radius' in var_lower:
-            self.patterns["design_tokens"]["border_radius"].add(f"{var_name}: {value}")
-        elif any(keyword in var_lower for keyword in ['spacing', 'gap', 'padding', 'margin']):
-            self.patterns["design_tokens"]["spacing"].add(f"{var_name}: {value}")
-        elif 'font-family' in var_lower:
-            self.patterns["design_tokens"]["font_families"].add(f"{var_name}: {value}")
-        elif 'font-size' in var_lower:
-            self.patterns["design_tokens"]["font_sizes"].add(f"{var_name}: {value}")
-        elif 'z-index' in var_lower:
-            self.patterns["design_tokens"]["z_index"].add(f"{var_name}: {value}")
+    def _walk_once(self):
+        """Yield every project file as an os.DirEntry, pruning build and vendor dirs."""
+        stack = [str(self.project_path)]
+        
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in _PRUNE_DIRS:
+                                stack.append(entry.path)
+                        elif entry.is_file():
+                            yield entry
+            except OSError:
+                continue
     
-    def _analyze_component_patterns(self):
-        """Analyze component structure patterns."""
-        print("🧩 Analyzing component patterns...")
+    def _scan_files(self):
+        """Walk the project once and scan the relevant files across CPU cores."""
+        print("🎨 Extracting design tokens, component, naming and import patterns...")
+        
+        css_like = {'css', 'scss'}
+        ts_like = {'ts', 'tsx', 'js', 'jsx'}
+        component = {'tsx', 'jsx', 'vue'}
         
-        component_files = []
-        for ext in ['.tsx', '.jsx', '.vue']:
-            component_files.extend(self.project_path.rglob(f'*{ext}'))
+        component_count = 0
+        import_counts = defaultdict(int)
+        tasks = []
         
-        for file_path in component_files[:10]:  # Sample first 10 components
-            if 'node_modules' in str(file_path):
+        token_candidates = self._ripgrep_token_candidates()
+        token_cache = self._load_token_cache()
+        cache_keys = []
+        prefix_len = len(os.path.join(str(self.project_path), ''))
+        
+        for entry in self._walk_once():
+            if entry.name.startswith(_CACHE_FILENAME):
+                continue  # Our own cache (and its journal) isn't project code
+            self._analyze_file_naming(entry.name)
+            
+            ext = entry.name.rsplit('.', 1)[-1]
+            wants_tokens = (ext in css_like or ext in ts_like) and (
+                token_candidates is None or os.path.normpath(entry.path) in token_candidates
+            )
+            wants_component = ext in component and component_count < _COMPONENT_SAMPLE_SIZE
+            wants_imports = ext in ts_like and import_counts[ext] < _IMPORT_SAMPLE_SIZE
+            if not (wants_tokens or wants_component or wants_imports):
                 continue
             
+            component_count += wants_component
+            import_counts[ext] += wants_imports
+            
+            # Cache rows are keyed by project-relative path
+            cache_key = entry.path[prefix_len:] if wants_tokens else None
+            cached = token_cache.get(cache_key)
+            cache_keys.append(cache_key)
+            tasks.append((entry.path, wants_tokens, wants_component, wants_imports,
+                          cached[0] if cached else None))
+        
+        results = None
+        if len(tasks) >= _PARALLEL_MIN_FILES and (os.cpu_count() or 1) > 1:
             try:
-                content = file_path.read_text(encoding='utf-8')
-                
-                # Detect patterns
-                pattern = {
-                    "file": str(file_path.relative_to(self.project_path)),
-                    "has_typescript": file_path.suffix in ['.tsx', '.ts'],
-                    "has_props_interface": 'interface Props' in content or 'type Props' in content,
-                    "uses_hooks": any(hook in content for hook in ['useState', 'useEffect', 'useCallback', 'useMemo']),
-                    "uses_children": 'children' in content,
-                    "exports_default": 'export default' in content,
-                    "exports_named": 'export {' in content or 'export const' in content,
-                }
-                
-                self.patterns["component_patterns"].append(pattern)
-            except Exception:
-                continue
-    
-    def _analyze_naming_conventions(self):
-        """Analyze naming conventions for files, components, variables."""
-        print("📝 Analyzing naming conventions...")
-        
-        for file_path in self.project_path.rglob('*'):
-            if file_path.is_file() and not any(skip in str(file_path) for skip in ['node_modules', '.git']):
-                filename = file_path.stem
-                
-                # File naming patterns
-                if '-' in filename:
-                    self.patterns["naming_conventions"]["files"].append("kebab-case")
-                elif '_' in filename:
-                    self.patterns["naming_conventions"]["files"].append("snake_case")
-                elif filename[0].isupper():
-                    self.patterns["naming_conventions"]["files"].append("PascalCase")
-                elif filename[0].islower() and filename[1:].islower():
-                    self.patterns["naming_conventions"]["files"].append("lowercase")
-    
-    def _analyze_import_patterns(self):
-        """Analyze import statement patterns."""
-        print("📦 Analyzing import patterns...")
+                with ProcessPoolExecutor() as executor:
+                    results = list(executor.map(_scan_file, tasks, chunksize=64))
+            except (OSError, RuntimeError, NotImplementedError):
+                results = None  # No usable process pool here; scan serially
+        if results is None:
+            results = map(_scan_file, tasks)
         
+        tokens = self.patterns["design_tokens"]
         import_patterns = {
             "absolute": [],
             "relative": [],
             "alias": []
         }
         
-        for ext in ['.ts', '.tsx', '.js', '.jsx']:
-            for file_path in list(self.project_path.rglob(f'*{ext}'))[:20]:
-                if 'node_modules' in str(file_path):
-                    continue
-                
-                try:
-                    content = file_path.read_text(encoding='utf-8')
-                    
-                    # Find import statements
-                    import_lines = re.findall(r'import\s+.*?from\s+[\'"]([^\'"]+)[\'"]', content)
-                    
-                    for imp in import_lines:
-                        if imp.startswith('@/'):
-                            import_patterns["alias"].append(imp)
-                        elif imp.startswith('.'):
-                            import_patterns["relative"].append(imp)
-                        else:
-                            import_patterns["absolute"].append(imp)
-                except Exception:
-                    continue
+        cache_updates = []
+        
+        for task, cache_key, partial in zip(tasks, cache_keys, results):
+            if partial is None:
+                continue
+            
+            if partial["tokens"] is None:
+                file_tokens = token_cache[cache_key][1]
+            else:
+                file_tokens = {k: sorted(v) for k, v in partial["tokens"].items() if v}
+                if cache_key is not None:
+                    cache_updates.append((cache_key, partial["sha256"], _json_dumps(file_tokens)))
+            
+            for category, values in file_tokens.items():
+                tokens[category].update(values)
+            
+            if partial["component"] is not None:
+                pattern = {"file": str(Path(task[0]).relative_to(self.project_path))}
+                pattern.update(partial["component"])
+                self.patterns["component_patterns"].append(pattern)
+            
+            for kind, imports in partial["imports"].items():
+                import_patterns[kind].extend(imports)
         
         self.patterns["import_patterns"] = import_patterns
+        
+        self._save_token_cache(cache_updates, set(token_cache).difference(cache_keys))
+    
+    def _ripgrep_token_candidates(self) -> Optional[Set[str]]:
+        """
+        Use ripgrep, if installed, to find the files that can contain tokens.
+        
+        One native, multithreaded pass over the project lets the Python
+        scan skip token extraction for every file without a candidate match.
+        
+        Returns:
+            Normalized paths of candidate files, or None if ripgrep is
+            unavailable or failed and every file should be scanned
+        """
+        rg = shutil.which('rg')
+        if rg is None:
+            return None
+        
+        command = [
+            rg, '--files-with-matches', '--null', '--no-messages', '--no-config',
+            '--no-ignore', '--hidden', '--follow', '--text',
+            '-g', '*.{css,scss,ts,tsx,js,jsx}',
+        ]
+        for skip in sorted(_PRUNE_DIRS):
+            command += ['-g', f'!{skip}']
+        command += ['-e', _TOKEN_PREFILTER, '--', str(self.project_path)]
+        
+        try:
+            completed = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        except OSError:
+            return None
+        
+        # 0: matches found, 1: no matches; anything else is an error
+        if completed.returncode not in (0, 1):
+            return None
+        
+        return {os.path.normpath(os.fsdecode(path)) for path in completed.stdout.split(b'\0') if path}
+    
+    def _load_token_cache(self) -> Dict[str, Tuple[bytes, Dict[str, List[str]]]]:
+        """Open the project's token cache and load it as {path: (sha256, tokens)}."""
+        self._cache_db = None
+        if not self.use_cache:
+            return {}
+        
+        cache = {}
+        try:
+            self._cache_db = sqlite3.connect(str(self.project_path / _CACHE_FILENAME))
+            with self._cache_db:
+                self._cache_db.execute(
+                    "CREATE TABLE IF NOT EXISTS cache(path TEXT PRIMARY KEY, sha256 BLOB, tokens BLOB)"
+                )
+                self._cache_db.execute("CREATE TABLE IF NOT EXISTS meta(key TEXT PRIMARY KEY, value TEXT)")
+                row = self._cache_db.execute("SELECT value FROM meta WHERE key = 'fingerprint'").fetchone()
+                if row is None or row[0] != _CACHE_FINGERPRINT:
+                    # Written by a different extractor; its tokens can't be trusted
+                    self._cache_db.execute("DELETE FROM cache")
+                    self._cache_db.execute(
+                        "INSERT OR REPLACE INTO meta VALUES ('fingerprint', ?)", (_CACHE_FINGERPRINT,)
+                    )
+            for path, sha256, blob in self._cache_db.execute("SELECT path, sha256, tokens FROM cache"):
+                try:
+                    cache[path] = (sha256, _json_loads(blob))
+                except ValueError:
+                    continue  # Unreadable row; the file just gets rescanned
+        except sqlite3.Error:
+            # Read-only project or corrupt cache: analyze without caching
+            if self._cache_db is not None:
+                self._cache_db.close()
+                self._cache_db = None
+            return {}
+        
+        return cache
+    
+    def _save_token_cache(self, updates: List[Tuple[str, bytes, bytes]], stale: Set[str]):
+        """Store freshly scanned files and drop rows for files that are gone."""
+        if self._cache_db is None:
+            return
+        
+        try:
+            with self._cache_db:
+                self._cache_db.executemany("INSERT OR REPLACE INTO cache VALUES (?, ?, ?)", updates)
+                self._cache_db.executemany("DELETE FROM cache WHERE path = ?", ((path,) for path in stale))
+        except sqlite3.Error:
+            pass  # A failed cache write only costs speed on the next run
+        finally:
+            self._cache_db.close()
+            self._cache_db = None
+    
+    def _analyze_file_naming(self, name: str):
+        """Record the naming convention of a single file."""
+        filename = os.path.splitext(name)[0]
+        
+        # File naming patterns
+        if '-' in filename:
+            self._naming_counter["kebab-case"] += 1
+        elif '_' in filename:
+            self._naming_counter["snake_case"] += 1
+        elif filename[:1].isupper():
+            self._naming_counter["PascalCase"] += 1
+        elif filename[:1].islower() and filename[1:].islower():
+            self._naming_counter["lowercase"] += 1
     
     def _generate_report(self) -> Dict:
         """Generate final analysis report."""
@@ -251,11 +529,11 @@ class FrontendAnalyzer:
         for category in self.patterns["design_tokens"]:
             self.patterns["design_tokens"][category] = sorted(list(self.patterns["design_tokens"][category]))
         
-        # Calculate most common naming convention
-        file_naming = self.patterns["naming_conventions"]["files"]
+        # File naming counts, most common first
+        file_naming = self._naming_counter.most_common()
+        self.patterns["naming_conventions"]["files"] = dict(file_naming)
         if file_naming:
-            most_common = max(set(file_naming), key=file_naming.count)
-            self.patterns["naming_conventions"]["most_common_file"] = most_common
+            self.patterns["naming_conventions"]["most_common_file"] = file_naming[0][0]
         
         return self.patterns
     
@@ -263,8 +541,12 @@ class FrontendAnalyzer:
         """Save analysis report to file."""
         report = self.analyze()
         
-        with open(output_path, 'w') as f:
-            json.dump(report, f, indent=2)
+        if orjson is not None:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
         
         print(f"📄 Report saved to: {output_path}")
         return report
@@ -273,14 +555,15 @@ class FrontendAnalyzer:
 def main():
     import sys
     
-    if len(sys.argv) < 2:
-        print("Usage: python analyze_project.py <project_path> [output_path]")
+    args = [arg for arg in sys.argv[1:] if arg != '--no-cache']
+    if not args:
+        print("Usage: python analyze_project.py <project_path> [output_path] [--no-cache]")
         sys.exit(1)
     
-    project_path = sys.argv[1]
-    output_path = sys.argv[2] if len(sys.argv) > 2 else "project_analysis.json"
+    project_path = args[0]
+    output_path = args[1] if len(args) > 1 else "project_analysis.json"
     
-    analyzer = FrontendAnalyzer(project_path)
+    analyzer = FrontendAnalyzer(project_path, use_cache='--no-cache' not in sys.argv)
     analyzer.save_report(output_path)
 
 
@@ -24,14 +24,54 @@ if sys.version_info[0] == 3 and sys.version_info[1] < 6:
 
 import json
 import re
+from collections import Counter
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+try:
+    import orjson  # Optional: much faster loading of large pattern files
+except ImportError:
+    orjson = None
+
+try:
+    import re2  # Optional: google-re2 scans in guaranteed linear time
+except ImportError:
+    re2 = None
+
+
+def _compile_linear(pattern: bytes):
+    """Compile with RE2's linear-time engine when installed, else with re."""
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern)
+
+
+# Patterns run on raw file bytes; see _check_design_tokens for the literal
+# prefilters that let most files skip them entirely
+_COLOR_RE = _compile_linear(rb'(?:color|background|bg|border):\s*(#[0-9a-fA-F]{3,8}|rgba?\([^)]+\))')
+_SHADOW_RE = _compile_linear(rb'box-shadow:\s*([^;]+);')
+_RADIUS_RE = _compile_linear(rb'border-radius:\s*(\d+px)')
+_IMPORT_RE = _compile_linear(rb'import\s+.*?from\s+[\'"]([^\'"]+)[\'"]')
+
 class ComplianceChecker:
     def __init__(self, patterns_file: str):
         """Initialize with previously analyzed patterns."""
-        with open(patterns_file, 'r') as f:
-            self.patterns = json.load(f)
+        with open(patterns_file, 'rb') as f:
+            data = f.read()
+        self.patterns = orjson.loads(data) if orjson is not None else json.loads(data.decode('utf-8'))
+        
+        # Token values without their variable names, for O(1) lookups
+        design_tokens = self.patterns.get("design_tokens", {})
+        self._color_token_set = self._token_values(design_tokens.get("colors", []))
+        self._radius_token_set = self._token_values(design_tokens.get("border_radius", []))
+    
+    @staticmethod
+    def _token_values(tokens: List[str]) -> frozenset:
+        """Strip the '--name:' prefix from tokens, keeping just their values."""
+        return frozenset(t.split(':')[-1].strip() if ':' in t else t for t in tokens)
     
     def check_component(self, component_path: str) -> Dict:
         """Check if component follows established patterns."""
@@ -45,7 +85,7 @@ class ComplianceChecker:
         if not component_file.exists():
             return {"error": "File not found"}
         
-        content = component_file.read_text(encoding='utf-8')
+        content = component_file.read_bytes()
         filename = component_file.stem
         
         # Check naming convention
@@ -99,34 +139,34 @@ class ComplianceChecker:
         
         return issues
     
-    def _check_design_tokens(self, content: str) -> List[str]:
+    def _check_design_tokens(self, content: bytes) -> List[str]:
         """Check if hardcoded values are used instead of design tokens."""
         warnings = []
         
+        # Each regex only runs if the file contains the literal it needs;
+        # bytes substring search is far cheaper than starting a regex scan
+        
         # Check for hardcoded colors
-        hardcoded_colors = re.findall(r'(?:color|background|bg|border):\s*(#[0-9a-fA-F]{3,8}|rgba?\([^)]+\))', content)
-        if hardcoded_colors:
-            project_colors = self.patterns["design_tokens"].get("colors", [])
-            for color in hardcoded_colors:
-                if color not in [c.split(':')[-1].strip() if ':' in c else c for c in project_colors]:
+        if b'#' in content or b'rgb' in content:
+            for color in _COLOR_RE.findall(content):
+                color = color.decode('utf-8', 'replace')
+                if color not in self._color_token_set:
                     warnings.append(f"Hardcoded color '{color}' - consider using design token")
         
         # Check for hardcoded shadows
-        hardcoded_shadows = re.findall(r'box-shadow:\s*([^;]+);', content)
-        if hardcoded_shadows:
+        if b'box-shadow' in content and _SHADOW_RE.search(content):
             warnings.append("Custom box-shadow detected - consider using design token")
         
         # Check for hardcoded border radius
-        hardcoded_radius = re.findall(r'border-radius:\s*(\d+px)', content)
-        if hardcoded_radius:
-            project_radii = self.patterns["design_tokens"].get("border_radius", [])
-            for radius in hardcoded_radius:
-                if radius not in [r.split(':')[-1].strip() if ':' in r else r for r in project_radii]:
+        if b'border-radius' in content:
+            for radius in _RADIUS_RE.findall(content):
+                radius = radius.decode('ascii')
+                if radius not in self._radius_token_set:
                     warnings.append(f"Custom border-radius '{radius}' - consider using design token")
         
         return warnings
     
-    def _check_component_structure(self, content: str, file_extension: str) -> List[str]:
+    def _check_component_structure(self, content: bytes, file_extension: str) -> List[str]:
         """Check component structure against common patterns."""
         suggestions = []
         
@@ -135,35 +175,39 @@ class ComplianceChecker:
         
         # Analyze what's common in existing components
         common_patterns = self.patterns["component_patterns"]
+        total = len(common_patterns)
+        
+        # Tally every trait in a single pass over the sampled components
+        trait_counts = Counter(k for p in common_patterns for k, v in p.items() if k != "file" and v)
         
         # Check TypeScript usage
-        ts_usage = sum(1 for p in common_patterns if p.get("has_typescript")) / len(common_patterns)
+        ts_usage = trait_counts["has_typescript"] / total
         if ts_usage > 0.7 and file_extension not in ['.tsx', '.ts']:
             suggestions.append("Most components use TypeScript - consider using .tsx/.ts")
         
         # Check Props interface
-        props_usage = sum(1 for p in common_patterns if p.get("has_props_interface")) / len(common_patterns)
-        if props_usage > 0.7 and not ('interface Props' in content or 'type Props' in content):
+        props_usage = trait_counts["has_props_interface"] / total
+        if props_usage > 0.7 and not (b'interface Props' in content or b'type Props' in content):
             suggestions.append("Most components define Props interface/type - consider adding one")
         
         # Check export pattern
-        default_export = sum(1 for p in common_patterns if p.get("exports_default")) / len(common_patterns)
-        if default_export > 0.7 and 'export default' not in content:
+        default_export = trait_counts["exports_default"] / total
+        if default_export > 0.7 and b'export default' not in content:
             suggestions.append("Most components use default export")
         
         return suggestions
     
-    def _check_imports(self, content: str) -> List[str]:
+    def _check_imports(self, content: bytes) -> List[str]:
         """Check if imports follow project patterns."""
         suggestions = []
         
         import_patterns = self.patterns.get("import_patterns", {})
         
         # Find imports in this file
-        import_lines = re.findall(r'import\s+.*?from\s+[\'"]([^\'"]+)[\'"]', content)
+        import_lines = _IMPORT_RE.findall(content)
         
-        alias_count = sum(1 for imp in import_lines if imp.startswith('@/'))
-        relative_count = sum(1 for imp in import_lines if imp.startswith('.'))
+        alias_count = sum(1 for imp in import_lines if imp.startswith(b'@/'))
+        relative_count = sum(1 for imp in import_lines if imp.startswith(b'.'))
         
         # Check project preference
         project_alias = len(import_patterns.get("alias", []))
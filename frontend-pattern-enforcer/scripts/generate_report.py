@@ -24,13 +24,19 @@ if sys.version_info[0] == 3 and sys.version_info[1] < 6:
 
 import json
 import sys
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
 
+def _pct(count: int, total: int) -> str:
+    """Format count as a whole-number percentage of total."""
+    return f"{count / total * 100:.0f}%"
+
+
 def generate_markdown_report(analysis_file: str, output_file: str = None):
     """Convert JSON analysis to readable markdown."""
     
-    with open(analysis_file, 'r') as f:
+    with open(analysis_file, 'r', encoding='utf-8') as f:
         data = json.load(f)
     
     if output_file is None:
@@ -48,41 +54,19 @@ def generate_markdown_report(analysis_file: str, output_file: str = None):
     
     tokens = data.get("design_tokens", {})
     
-    if tokens.get("colors"):
-        md_content.append("### Colors")
-        md_content.append("```css")
-        for color in tokens["colors"][:15]:  # Limit to first 15
-            md_content.append(color)
-        if len(tokens["colors"]) > 15:
-            md_content.append(f"... and {len(tokens['colors']) - 15} more")
-        md_content.append("```\n")
-    
-    if tokens.get("shadows"):
-        md_content.append("### Box Shadows")
-        md_content.append("```css")
-        for shadow in tokens["shadows"][:10]:
-            md_content.append(shadow)
-        if len(tokens["shadows"]) > 10:
-            md_content.append(f"... and {len(tokens['shadows']) - 10} more")
-        md_content.append("```\n")
-    
-    if tokens.get("border_radius"):
-        md_content.append("### Border Radius")
-        md_content.append("```css")
-        for radius in tokens["border_radius"][:10]:
-            md_content.append(radius)
-        if len(tokens["border_radius"]) > 10:
-            md_content.append(f"... and {len(tokens['border_radius']) - 10} more")
-        md_content.append("```\n")
-    
-    if tokens.get("spacing"):
-        md_content.append("### Spacing")
-        md_content.append("```css")
-        for space in tokens["spacing"][:10]:
-            md_content.append(space)
-        if len(tokens["spacing"]) > 10:
-            md_content.append(f"... and {len(tokens['spacing']) - 10} more")
-        md_content.append("```\n")
+    token_sections = [
+        ("colors", "Colors", 15),
+        ("shadows", "Box Shadows", 10),
+        ("border_radius", "Border Radius", 10),
+        ("spacing", "Spacing", 10),
+    ]
+    for key, title, limit in token_sections:
+        values = tokens.get(key)
+        if not values:
+            continue
+        shown = "\n".join(values[:limit])
+        more = f"\n... and {len(values) - limit} more" if len(values) > limit else ""
+        md_content.append(f"### {title}\n```css\n{shown}{more}\n```\n")
     
     # Folder Structure
     md_content.append("## 📁 Folder Structure\n")
@@ -106,17 +90,19 @@ def generate_markdown_report(analysis_file: str, output_file: str = None):
     if patterns:
         # Calculate statistics
         total = len(patterns)
-        ts_count = sum(1 for p in patterns if p.get("has_typescript"))
-        props_count = sum(1 for p in patterns if p.get("has_props_interface"))
-        hooks_count = sum(1 for p in patterns if p.get("uses_hooks"))
-        default_export = sum(1 for p in patterns if p.get("exports_default"))
+        trait_counts = Counter(k for p in patterns for k, v in p.items() if k != "file" and v)
+        ts_count = trait_counts["has_typescript"]
+        props_count = trait_counts["has_props_interface"]
+        hooks_count = trait_counts["uses_hooks"]
+        default_export = trait_counts["exports_default"]
         
-        md_content.append(f"Analyzed {total} components:\n")
-        md_content.append(f"- **TypeScript usage:** {ts_count}/{total} ({ts_count/total*100:.0f}%)")
-        md_content.append(f"- **Props interface defined:** {props_count}/{total} ({props_count/total*100:.0f}%)")
-        md_content.append(f"- **Using React hooks:** {hooks_count}/{total} ({hooks_count/total*100:.0f}%)")
-        md_content.append(f"- **Default exports:** {default_export}/{total} ({default_export/total*100:.0f}%)")
-        md_content.append("")
+        md_content.append(
+            f"Analyzed {total} components:\n\n"
+            f"- **TypeScript usage:** {ts_count}/{total} ({_pct(ts_count, total)})\n"
+            f"- **Props interface defined:** {props_count}/{total} ({_pct(props_count, total)})\n"
+            f"- **Using React hooks:** {hooks_count}/{total} ({_pct(hooks_count, total)})\n"
+            f"- **Default exports:** {default_export}/{total} ({_pct(default_export, total)})\n"
+        )
     else:
         md_content.append("*No component patterns analyzed*\n")
     
@@ -141,10 +127,11 @@ def generate_markdown_report(analysis_file: str, output_file: str = None):
     total_imports = alias_count + relative_count + absolute_count
     
     if total_imports > 0:
-        md_content.append(f"- **Path aliases (@/):** {alias_count} ({alias_count/total_imports*100:.0f}%)")
-        md_content.append(f"- **Relative imports (./):** {relative_count} ({relative_count/total_imports*100:.0f}%)")
-        md_content.append(f"- **Absolute imports:** {absolute_count} ({absolute_count/total_imports*100:.0f}%)")
-        md_content.append("")
+        md_content.append(
+            f"- **Path aliases (@/):** {alias_count} ({_pct(alias_count, total_imports)})\n"
+            f"- **Relative imports (./):** {relative_count} ({_pct(relative_count, total_imports)})\n"
+            f"- **Absolute imports:** {absolute_count} ({_pct(absolute_count, total_imports)})\n"
+        )
         
         if alias_count > relative_count:
             md_content.append("**Recommendation:** Project prefers path aliases (@/)\n")
@@ -156,7 +143,7 @@ def generate_markdown_report(analysis_file: str, output_file: str = None):
     # Write to file
     content = "\n".join(md_content)
     
-    with open(output_file, 'w') as f:
+    with open(output_file, 'w', encoding='utf-8') as f:
         f.write(content)
     
     print(f"✅ Markdown report generated: {output_file}")